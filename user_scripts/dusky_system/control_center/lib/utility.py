@@ -6,21 +6,30 @@ All file I/O is atomic. All public functions are safe to call from any thread.
 """
 from __future__ import annotations
 
+import copy
+import functools
 import logging
 import os
 import re
 import shlex
 import shutil
+import signal
 import subprocess
 import sys
 import tempfile
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Mapping
 from pathlib import Path
+from types import MappingProxyType, ModuleType
 from typing import TYPE_CHECKING, Final, TypeVar, overload
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from gi.repository import Adw
 
@@ -35,19 +44,62 @@ __all__ = [
     "load_setting",
     "preflight_check",
     "save_setting",
+    "save_settings_batch",
     "toast",
 ]
 
 log: logging.Logger = logging.getLogger(__name__)
 
+# gi.repository modules, bound once by preflight_check() so toast() skips the
+# import machinery on every call
+_Adw: ModuleType | None = None
+_GLib: ModuleType | None = None
+# Thread that ran preflight_check() (and so owns the GTK main loop)
+_main_thread_id: int | None = None
+
 _T = TypeVar("_T")
 
 # =============================================================================
 # CONSTANTS & PATHS
 # =============================================================================
 LABEL_NA: Final[str] = "N/A"
-_SHELL_METACHARACTERS: Final[frozenset[str]] = frozenset("|&;()<>$`\\\"'*?[]#~=!{}%")
+_UWSM_APP: Final[str] = "uwsm-app"
+_BOOL_STRINGS: Final[dict[str, bool]] = {
+    "1": True, "true": True, "yes": True, "on": True,
+    "0": False, "false": False, "no": False, "off": False, "": False,
+}
+_PCI_IDS_PATHS: Final[tuple[str, ...]] = (
+    "/usr/share/hwdata/pci.ids",
+    "/usr/share/misc/pci.ids",
+)
+# PCI class prefixes for "VGA compatible controller" and "3D controller"
+_PCI_DISPLAY_CLASSES: Final[tuple[str, ...]] = ("0x0300", "0x0302")
+_SYSTEM_INFO_KEYS: Final[tuple[str, ...]] = (
+    "memory_total", "cpu_model", "gpu_model", "kernel_version",
+)
+_SHELL_METACHARACTERS: Final[str] = "|&;()<>$`\\\"'*?[]#~=!{}%"
+_SHELL_META_PATTERN: Final[re.Pattern[str]] = re.compile(
+    f"[{re.escape(_SHELL_METACHARACTERS)}]"
+)
 _TILDE_PATTERN: Final[re.Pattern[str]] = re.compile(r"(?:^|(?<=\s))~(?=/|$|\s)")
+# ASCII control characters (incl. NUL, tab, newlines) and DEL -> space
+_TITLE_CONTROL_TRANS: Final[dict[int, int]] = {
+    **{codepoint: 0x20 for codepoint in range(0x20)}, 0x7F: 0x20,
+}
+# First "model name" line of /proc/cpuinfo, minus any trailing "@ <clock>"
+_CPU_MODEL_PATTERN: Final[re.Pattern[bytes]] = re.compile(
+    rb"^model name[ \t]*:[ \t]*(.+?)(?:[ \t]*@.*)?$", re.MULTILINE
+)
+
+# posix_spawn avoids fork()'s page-table copy of our (large) GTK process
+_HAS_POSIX_SPAWN: Final[bool] = hasattr(os, "posix_spawnp")
+_DEVNULL_FILE_ACTIONS: Final[tuple[tuple[object, ...], ...]] = (
+    (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+    (os.POSIX_SPAWN_DUP2, 1, 2),
+) if _HAS_POSIX_SPAWN else ()
+# Python ignores these; reset them for children as Popen's restore_signals does
+_RESTORED_SIGNALS: Final[tuple[signal.Signals, ...]] = (signal.SIGPIPE, signal.SIGXFSZ)
 
 
 def _get_xdg_path(env_var: str, default_suffix: str) -> Path:
@@ -83,6 +135,11 @@ class _ResolvedDirectoryCache:
         self._lock: Final[threading.Lock] = threading.Lock()
         self._resolved: Path | None = None
 
+    @property
+    def is_resolved(self) -> bool:
+        """Whether resolution has succeeded (and is now permanently cached)."""
+        return self._resolved is not None
+
     def get(self) -> Path:
         """Get the resolved directory path, creating it if necessary."""
         # Fast path: atomic read
@@ -158,6 +215,51 @@ class _ComputeOnceCache:
 _settings_dir_cache: Final = _ResolvedDirectoryCache(SETTINGS_DIR)
 _cache_dir_cache: Final = _ResolvedDirectoryCache(CACHE_DIR)
 _system_info_cache: Final = _ComputeOnceCache()
+# Immutable snapshot published once every key is computed; read without locks
+_system_info_snapshot: Mapping[str, str] = MappingProxyType({})
+# Startup snapshot of the settings directory, keyed by resolved path, holding
+# (file signature, value). An entry is served once (dict.pop is atomic under
+# the GIL) and only if the file's signature is unchanged, so pages built long
+# after startup never see a stale value; a stat replaces the open+read.
+_settings_preload: dict[str, tuple[tuple[int, int, int], str]] = {}
+
+
+_unreaped_pids_lock: Final = threading.Lock()
+_unreaped_pids: set[int] = set()
+
+_uwsm_app_lock: Final = threading.Lock()
+_uwsm_app_path: str | None = None
+
+
+def _resolve_uwsm_app() -> str | None:
+    """Absolute path of uwsm-app, looked up in $PATH once and then memoized."""
+    global _uwsm_app_path
+    # Fast path: atomic read
+    path = _uwsm_app_path
+    if path is not None:
+        return path
+
+    with _uwsm_app_lock:
+        # Double-check; a miss is not cached so a later install is picked up
+        if _uwsm_app_path is None:
+            _uwsm_app_path = shutil.which(_UWSM_APP)
+        return _uwsm_app_path
+
+
+def _get_settings_dir() -> str:
+    """
+    Get the resolved settings directory as a plain string path.
+    Once resolution succeeds this name is rebound to a constant getter, so
+    later calls skip the cache's lock and None checks entirely.
+    """
+    global _get_settings_dir
+    resolved = str(_settings_dir_cache.get())
+    if _settings_dir_cache.is_resolved:
+        def _resolved_settings_dir() -> str:
+            return resolved
+
+        _get_settings_dir = _resolved_settings_dir
+    return resolved
 
 
 def get_cache_dir() -> Path:
@@ -171,18 +273,24 @@ def get_cache_dir() -> Path:
 def load_config(config_path: Path) -> dict[str, object]:
     """Load and parse YAML configuration safely."""
     try:
-        content = config_path.read_text(encoding="utf-8")
+        st = config_path.stat()
+        data = _parse_yaml_file(str(config_path), st.st_mtime_ns, st.st_size)
     except (FileNotFoundError, OSError) as e:
         log.warning("Config file unreadable: %s (%s)", config_path, e)
         return {}
-
-    try:
-        data = yaml.safe_load(content)
     except yaml.YAMLError as e:
         log.error("YAML syntax error in %s: %s", config_path, e)
         return {}
 
-    return data if isinstance(data, dict) else {}
+    # Hand out a private copy so callers can't corrupt the cached document
+    return copy.deepcopy(data) if isinstance(data, dict) else {}
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> object:
+    """Parse a YAML file. Keyed on stat fields so edits invalidate the entry."""
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 # =============================================================================
@@ -208,15 +316,7 @@ def execute_command(cmd_string: str, title: str, run_in_terminal: bool) -> bool:
         return False
 
     try:
-        # start_new_session=True fully detaches the process
-        subprocess.Popen(
-            full_cmd,
-            start_new_session=True,
-            stdin=subprocess.DEVNULL,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            close_fds=True,
-        )
+        _spawn_detached(full_cmd)
         return True
     except FileNotFoundError:
         log.error(
@@ -229,23 +329,83 @@ def execute_command(cmd_string: str, title: str, run_in_terminal: bool) -> bool:
         return False
 
 
+def _spawn_detached(argv: list[str]) -> None:
+    """Start argv in a new session with stdio on /dev/null, without waiting."""
+    if _HAS_POSIX_SPAWN:
+        try:
+            pid = os.posix_spawnp(
+                argv[0], argv, os.environ,
+                file_actions=_DEVNULL_FILE_ACTIONS,
+                setsid=True,
+                setsigdef=_RESTORED_SIGNALS,
+            )
+        except FileNotFoundError:
+            # Popen would only fail the same way
+            raise
+        except OSError as e:
+            log.debug("posix_spawnp failed for %r, falling back to Popen: %s", argv[0], e)
+        else:
+            _reap_when_done(pid)
+            return
+
+    # start_new_session=True fully detaches the process
+    subprocess.Popen(
+        argv,
+        start_new_session=True,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=True,
+    )
+
+
+def _reap_when_done(pid: int) -> None:
+    """Make sure a posix_spawn'd child never lingers as a zombie."""
+    glib = _GLib
+    if glib is not None:
+        # The app's main loop reaps it on exit; no thread parked per child
+        glib.child_watch_add(glib.PRIORITY_DEFAULT, pid, _on_child_exit)
+        return
+
+    # No GLib bound (preflight_check not run): sweep our own children instead.
+    # Only known pids are polled, so other code's subprocesses are untouched.
+    with _unreaped_pids_lock:
+        _unreaped_pids.add(pid)
+        for child in tuple(_unreaped_pids):
+            try:
+                done, _ = os.waitpid(child, os.WNOHANG)
+            except ChildProcessError:
+                done = child
+            if done:
+                _unreaped_pids.discard(child)
+
+
+def _on_child_exit(pid: int, status: int) -> None:
+    """GLib child-watch callback; GLib has already reaped the child."""
+
+
 def _expand_command(cmd_string: str) -> str:
     """Expand env vars ($HOME) and tilde (~)."""
-    expanded = os.path.expandvars(cmd_string)
-    
-    def _expand_tilde(match: re.Match[str]) -> str:
-        return str(Path.home())
+    expanded = cmd_string
+    # Most commands are plain invocations; only pay for expansion when needed
+    if "$" in expanded:
+        expanded = os.path.expandvars(expanded)
+
+    if "~" in expanded:
+        def _expand_tilde(match: re.Match[str]) -> str:
+            return str(Path.home())
 
-    expanded = _TILDE_PATTERN.sub(_expand_tilde, expanded)
+        expanded = _TILDE_PATTERN.sub(_expand_tilde, expanded)
     return expanded.strip()
 
 
 def _sanitize_title(title: str | None) -> str:
     """Sanitize window title string."""
     base = (title or "").strip() or "Dusky Terminal"
-    sanitized = "".join(
-        c if c.isprintable() and c not in "\n\r\t\x00" else " " for c in base
-    )
+    sanitized = base.translate(_TITLE_CONTROL_TRANS)
+    if not sanitized.isprintable():
+        # Rare: non-ASCII unprintables (format/separator chars) need a per-char pass
+        sanitized = "".join(c if c.isprintable() else " " for c in sanitized)
     return " ".join(sanitized.split()) or "Dusky Terminal"
 
 
@@ -253,9 +413,10 @@ def _build_command_list(
     expanded_cmd: str, safe_title: str, run_in_terminal: bool
 ) -> list[str] | None:
     """Construct the argv list for subprocess."""
+    uwsm_app = _resolve_uwsm_app() or _UWSM_APP
     if run_in_terminal:
         return [
-            "uwsm-app", "--",
+            uwsm_app, "--",
             "kitty",
             "--class", "dusky-term",
             "--title", safe_title,
@@ -264,19 +425,19 @@ def _build_command_list(
         ]
 
     # Use shell if command contains metacharacters
-    needs_shell = any(c in expanded_cmd for c in _SHELL_METACHARACTERS)
+    needs_shell = _SHELL_META_PATTERN.search(expanded_cmd) is not None
     if needs_shell:
-        return ["uwsm-app", "--", "sh", "-c", expanded_cmd]
+        return [uwsm_app, "--", "sh", "-c", expanded_cmd]
 
     try:
         parsed_args = shlex.split(expanded_cmd)
     except ValueError:
-        return ["uwsm-app", "--", "sh", "-c", expanded_cmd]
+        return [uwsm_app, "--", "sh", "-c", expanded_cmd]
 
     if not parsed_args:
         return None
 
-    return ["uwsm-app", "--", *parsed_args]
+    return [uwsm_app, "--", *parsed_args]
 
 
 # =============================================================================
@@ -287,35 +448,42 @@ def preflight_check() -> None:
     Check for critical dependencies (GTK, UWSM).
     Exits with error message if missing.
     """
+    global _Adw, _GLib, _main_thread_id
     missing_deps: list[str] = []
 
     try:
         import gi
         gi.require_version("Gtk", "4.0")
         gi.require_version("Adw", "1")
+        from gi.repository import Adw as AdwLib, GLib
     except (ImportError, ValueError):
         missing_deps.append("python-gobject (GTK4/Libadwaita)")
+    else:
+        _Adw, _GLib = AdwLib, GLib
+        _main_thread_id = threading.get_ident()
 
-    if shutil.which("uwsm-app") is None:
+    if _resolve_uwsm_app() is None:
         missing_deps.append("uwsm (Universal Wayland Session Manager)")
 
     if missing_deps:
-        msg = (
-            "FATAL: Dusky Control Center missing dependencies:\n"
-            + "\n".join(f"  - {dep}" for dep in missing_deps)
+        # Reaches stderr via the app's handler, or logging's last-resort one
+        log.critical(
+            "FATAL: Dusky Control Center missing dependencies:\n%s",
+            "\n".join(f"  - {dep}" for dep in missing_deps),
         )
-        log.critical(msg)
-        print(msg, file=sys.stderr)
         sys.exit(1)
 
-    # Check write permissions
-    try:
-        SETTINGS_DIR.mkdir(parents=True, exist_ok=True)
-        test_file = SETTINGS_DIR / ".write_test"
-        test_file.touch()
-        test_file.unlink()
-    except OSError as e:
-        log.warning("Settings directory %s is not writable: %s", SETTINGS_DIR, e)
+    # Check write permissions (one faccessat; also reports read-only mounts)
+    settings_dir = _get_settings_dir()  # Creates the directory if missing
+    if not os.access(settings_dir, os.W_OK):
+        log.warning("Settings directory %s is not writable", settings_dir)
+
+    _preload_settings()
+
+    # Probe hardware off the main thread (pci.ids lookup reads a large file)
+    threading.Thread(
+        target=_warm_system_info, name="dusky-sysinfo", daemon=True
+    ).start()
 
 
 # =============================================================================
@@ -323,9 +491,23 @@ def preflight_check() -> None:
 # =============================================================================
 def get_system_value(key: str) -> str:
     """Get a system info value (cached lifetime)."""
+    # Fast path: lock-free once the warm-up snapshot is published
+    value = _system_info_snapshot.get(key)
+    if value is not None:
+        return value
+    if key not in _SYSTEM_INFO_KEYS:
+        return LABEL_NA
     return _system_info_cache.get_or_compute(key, lambda: _compute_system_value(key))
 
 
+def _warm_system_info() -> None:
+    """Compute every system value and publish them as an immutable snapshot."""
+    global _system_info_snapshot
+    # Goes through the coalescing cache so concurrent UI lookups share the work
+    values = {key: get_system_value(key) for key in _SYSTEM_INFO_KEYS}
+    _system_info_snapshot = MappingProxyType(values)
+
+
 def _compute_system_value(key: str) -> str:
     """Actual logic to fetch system info."""
     match key:
@@ -341,16 +523,24 @@ def _compute_system_value(key: str) -> str:
             return LABEL_NA
 
 
+def _read_proc_file(path: str, size: int) -> bytes:
+    """Read up to size bytes from a procfs/sysfs file in a single syscall."""
+    fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
 def _get_memory_total() -> str:
     try:
-        content = Path("/proc/meminfo").read_text(encoding="utf-8")
-        for line in content.splitlines():
-            if line.startswith("MemTotal:"):
-                parts = line.split()
-                if len(parts) >= 2:
-                    kb = int(parts[1])
-                    gb = round(kb / 1_048_576, 1)
-                    return f"{gb} GB"
+        # /proc/meminfo is well under 4 KiB and MemTotal is its first line
+        buf = _read_proc_file("/proc/meminfo", 4096)
+        _, found, rest = buf.partition(b"MemTotal:")
+        if found:
+            kb = int(rest.split(None, 1)[0])
+            gb = round(kb / 1_048_576, 1)
+            return f"{gb} GB"
     except (OSError, ValueError, IndexError):
         pass
     return LABEL_NA
@@ -358,116 +548,282 @@ def _get_memory_total() -> str:
 
 def _get_cpu_model() -> str:
     try:
-        content = Path("/proc/cpuinfo").read_text(encoding="utf-8")
-        for line in content.splitlines():
-            if line.strip().lower().startswith("model name"):
-                _, _, value = line.partition(":")
-                return value.strip().split(" @")[0]
+        # The first processor block (which holds the model name) fits easily
+        buf = _read_proc_file("/proc/cpuinfo", 16384)
+        if match := _CPU_MODEL_PATTERN.search(buf):
+            return match.group(1).decode("utf-8", errors="replace").strip()
     except OSError:
         pass
     return LABEL_NA
 
 
 def _get_gpu_model() -> str:
-    """Detect GPU using lspci (human-readable or machine format)."""
+    """Detect GPU from sysfs, naming it via the hwdata PCI ID database."""
     try:
-        # Try machine format first
-        res = subprocess.run(
-            ["lspci", "-mm"],
-            capture_output=True, text=True, timeout=5, check=False
-        )
-        if res.returncode == 0:
-            for line in res.stdout.splitlines():
-                if '"VGA compatible controller"' in line or '"3D controller"' in line:
-                    parts = line.split('"')
-                    if len(parts) >= 8:
-                        return f"{parts[5]} {parts[7]}".strip()
-        
-        # Fallback to standard
-        res = subprocess.run(
-            ["lspci"],
-            capture_output=True, text=True, timeout=5, check=False
-        )
-        if res.returncode == 0:
-            for line in res.stdout.splitlines():
-                if "VGA compatible controller" in line or "3D controller" in line:
-                    parts = line.split(":", 2)
-                    if len(parts) > 2:
-                        return parts[2].strip()
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        pass
+        # Sorted by PCI address, matching lspci's listing order
+        devices = sorted(os.scandir("/sys/bus/pci/devices"), key=lambda e: e.name)
+    except OSError:
+        return LABEL_NA
+
+    for dev in devices:
+        try:
+            pci_class = _read_proc_file(f"{dev.path}/class", 64).decode().strip()
+            if not pci_class.startswith(_PCI_DISPLAY_CLASSES):
+                continue
+            vendor_id = _read_proc_file(f"{dev.path}/vendor", 64).decode().strip()
+            device_id = _read_proc_file(f"{dev.path}/device", 64).decode().strip()
+        except (OSError, UnicodeDecodeError):
+            continue
+
+        vendor_id = vendor_id.removeprefix("0x").lower()
+        device_id = device_id.removeprefix("0x").lower()
+        if name := _lookup_pci_name(vendor_id, device_id):
+            return name
+        return f"PCI {vendor_id}:{device_id}"
     return LABEL_NA
 
 
+def _lookup_pci_name(vendor_id: str, device_id: str) -> str | None:
+    """Resolve "<vendor> <device>" from pci.ids, stopping at the vendor's block end."""
+    for ids_path in _PCI_IDS_PATHS:
+        try:
+            with open(ids_path, encoding="utf-8", errors="replace") as f:
+                vendor_name: str | None = None
+                for line in f:
+                    if vendor_name is None:
+                        if line.startswith(vendor_id) and line[4:6] == "  ":
+                            vendor_name = line[6:].strip()
+                        continue
+                    if line.startswith("\t\t") or line.startswith("#"):
+                        continue
+                    if not line.startswith("\t"):
+                        # Next vendor: device not listed
+                        return vendor_name
+                    if line[1:5] == device_id:
+                        return f"{vendor_name} {line[7:].strip()}"
+                if vendor_name is not None:
+                    return vendor_name
+        except OSError:
+            continue
+    return None
+
+
 # =============================================================================
 # SETTINGS PERSISTENCE (Atomic File I/O)
 # =============================================================================
-def _validate_settings_path(key: str) -> Path | None:
+def _validate_settings_path(key: str) -> str | None:
     """Prevent path traversal attacks."""
     if not key or not isinstance(key, str):
         return None
     if "\0" in key:
         return None
-    
+    # Keys come from a small fixed vocabulary; screen bad input before caching.
+    # Until the directory resolves we may be checking against a fallback base,
+    # so don't pin those answers for the session.
+    base = _get_settings_dir()
+    if not _settings_dir_cache.is_resolved:
+        return _check_settings_path(base, key)
+    return _resolve_settings_path(key)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_settings_path(key: str) -> str | None:
+    """Memoized _check_settings_path against the resolved settings dir."""
+    return _check_settings_path(_get_settings_dir(), key)
+
+
+def _check_settings_path(base: str, key: str) -> str | None:
+    """Resolve a key inside base, or None if it escapes it."""
+    # Plain strings throughout: no pathlib objects on the hot path
     try:
-        base = _settings_dir_cache.get()
-        # Resolve validates and removes ..
-        target = (base / key).resolve()
-        # Ensure it's strictly inside base
-        target.relative_to(base)
-        return target
+        # realpath validates and removes ..
+        target = os.path.realpath(os.path.join(base, key))
     except (ValueError, OSError):
+        target = None
+    # Ensure it's strictly inside base
+    if target is None or not target.startswith(base + os.sep):
         log.warning("Invalid settings path key: %r", key)
         return None
+    return target
+
+
+def _preload_settings() -> None:
+    """Read every top-level settings file in a single directory pass."""
+    base = _get_settings_dir()
+    loaded: dict[str, tuple[tuple[int, int, int], str]] = {}
+    try:
+        with os.scandir(base) as it:
+            for entry in it:
+                if entry.name.startswith(".") or not entry.is_file(follow_symlinks=False):
+                    continue
+                try:
+                    with open(entry.path, "rb") as f:
+                        # Signature from the same fd, so it matches what we read
+                        signature = _file_signature(os.fstat(f.fileno()))
+                        value = _decode_setting(f.read())
+                except (OSError, UnicodeDecodeError):
+                    continue
+                loaded[os.path.join(base, entry.name)] = (signature, value)
+    except OSError as e:
+        log.warning("Could not preload settings from %s: %s", base, e)
+        return
+    _settings_preload.update(loaded)
+
+
+def _file_signature(st: os.stat_result) -> tuple[int, int, int]:
+    """Identity of a file's current contents (a rename-replace changes st_ino)."""
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _decode_setting(data: bytes) -> str:
+    """Turn raw settings file bytes into the stored value."""
+    return data.decode("utf-8").strip()
 
 
 def save_setting(
-    key: str, value: bool | int | float | str, *, as_int: bool = False
+    key: str,
+    value: bool | int | float | str,
+    *,
+    as_int: bool = False,
+    durable: bool = True,
 ) -> bool:
-    """Atomic write to disk (Temp File -> Fsync -> Rename)."""
+    """
+    Atomic write to disk (Temp File -> Fsync -> Rename).
+
+    With durable=False the fsyncs are skipped: the replace is still atomic,
+    but the new value may be lost on power failure. Meant for high-frequency,
+    low-value state such as slider positions.
+    """
     target = _validate_settings_path(key)
     if target is None:
         return False
 
-    content = ("1" if value else "0") if (as_int and isinstance(value, bool)) else str(value)
-
-    temp_fd: int | None = None
-    temp_path: Path | None = None
+    content = _serialize_setting(value, as_int)
+    temp_path: str | None = None
 
     try:
-        target.parent.mkdir(parents=True, exist_ok=True)
-        temp_fd, temp_path_str = tempfile.mkstemp(
-            dir=target.parent, prefix=f".{target.name}.", suffix=".tmp"
-        )
-        temp_path = Path(temp_path_str)
-
-        with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
-            temp_fd = None  # Transferred to file object
-            f.write(content)
-            f.flush()
-            os.fsync(f.fileno())
-
-        temp_path.rename(target)
+        temp_path = _write_temp_file(target, content, durable=durable)
+        os.rename(temp_path, target)
         temp_path = None  # Prevent deletion of success file
+        if durable:
+            _fsync_dir(os.path.dirname(target))
 
-        # Sync parent directory
-        dir_fd = os.open(target.parent, os.O_RDONLY | os.O_DIRECTORY)
-        try:
-            os.fsync(dir_fd)
-        finally:
-            os.close(dir_fd)
-        
+        _settings_preload.pop(target, None)
         return True
 
     except OSError as e:
         log.error("Save failed for %s: %s", key, e)
         return False
     finally:
-        if temp_fd is not None:
-            os.close(temp_fd)
         if temp_path is not None:
             # Only unlinks if rename didn't happen
-            temp_path.unlink(missing_ok=True)
+            _unlink_quietly(temp_path)
+
+
+def save_settings_batch(
+    items: Iterable[tuple[str, bool | int | float | str]],
+    *,
+    as_int: bool = False,
+    durable: bool = True,
+) -> bool:
+    """
+    Save several settings, fsyncing each parent directory once for the batch.
+
+    Every file is replaced atomically, but the batch as a whole is not.
+    Returns True only if every item was saved.
+    """
+    ok = True
+    pending: list[tuple[str, str]] = []
+
+    try:
+        for key, value in items:
+            target = _validate_settings_path(key)
+            if target is None:
+                ok = False
+                continue
+            try:
+                temp_path = _write_temp_file(
+                    target, _serialize_setting(value, as_int), durable=durable
+                )
+            except OSError as e:
+                log.error("Save failed for %s: %s", key, e)
+                ok = False
+                continue
+            pending.append((temp_path, target))
+
+        synced_dirs: set[str] = set()
+        for temp_path, target in pending:
+            try:
+                os.rename(temp_path, target)
+            except OSError as e:
+                log.error("Save failed for %s: %s", os.path.basename(target), e)
+                ok = False
+                continue
+            _settings_preload.pop(target, None)
+            parent = os.path.dirname(target)
+            if durable and parent not in synced_dirs:
+                synced_dirs.add(parent)
+                try:
+                    _fsync_dir(parent)
+                except OSError as e:
+                    log.warning("Directory sync failed for %s: %s", parent, e)
+
+        return ok
+    finally:
+        for temp_path, _ in pending:
+            # Renamed entries are already gone; this only clears leftovers
+            _unlink_quietly(temp_path)
+
+
+def _serialize_setting(value: bool | int | float | str, as_int: bool) -> str:
+    """Render a setting value as file content."""
+    return ("1" if value else "0") if (as_int and isinstance(value, bool)) else str(value)
+
+
+def _write_temp_file(target: str, content: str, *, durable: bool) -> str:
+    """Write content to a fresh temp file next to target; the caller renames it."""
+    data = content.encode("utf-8")
+    parent, name = os.path.split(target)
+    os.makedirs(parent, exist_ok=True)
+    temp_fd, temp_path = tempfile.mkstemp(dir=parent, prefix=f".{name}.", suffix=".tmp")
+
+    try:
+        try:
+            _write_all(temp_fd, data, durable=durable)
+        finally:
+            os.close(temp_fd)
+    except BaseException:
+        _unlink_quietly(temp_path)
+        raise
+
+    return temp_path
+
+
+def _write_all(fd: int, data: bytes, *, durable: bool) -> None:
+    """Write all of data to fd, fsyncing if durable."""
+    # Raw fd writes: no TextIOWrapper/encoder setup for a few bytes
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+    if durable:
+        os.fsync(fd)
+
+
+def _unlink_quietly(path: str) -> None:
+    """Remove a file, ignoring it already being gone."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _fsync_dir(directory: str) -> None:
+    """Flush a directory entry so a completed rename survives a crash."""
+    dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
 
 
 @overload
@@ -492,10 +848,21 @@ def load_setting(
     if target is None:
         return default
 
-    try:
-        raw = target.read_text(encoding="utf-8").strip()
-    except (FileNotFoundError, OSError):
-        return default
+    raw: str | None = None
+    if (preloaded := _settings_preload.pop(target, None)) is not None:
+        signature, value = preloaded
+        try:
+            if _file_signature(os.stat(target)) == signature:
+                raw = value
+        except OSError:
+            pass  # Gone since startup; the read below reports it
+
+    if raw is None:
+        try:
+            with open(target, "rb") as f:
+                raw = _decode_setting(f.read())
+        except (FileNotFoundError, OSError, UnicodeDecodeError):
+            return default
 
     try:
         match default:
@@ -509,12 +876,11 @@ def load_setting(
 
 def _parse_bool(value: str, is_inversed: bool) -> bool:
     """Robust boolean parsing."""
-    lowered = value.lower().strip()
-    if lowered in {"true", "yes", "on", "1"}:
-        res = True
-    elif lowered in {"false", "no", "off", "0", ""}:
-        res = False
-    else:
+    # Exact hit covers the common "0"/"1"; normalise only on a miss
+    res = _BOOL_STRINGS.get(value)
+    if res is None:
+        res = _BOOL_STRINGS.get(value.lower().strip())
+    if res is None:
         try:
             res = (int(value) != 0) if len(value) < 20 else False
         except ValueError:
@@ -528,19 +894,26 @@ def _parse_bool(value: str, is_inversed: bool) -> bool:
 def toast(
     toast_overlay: Adw.ToastOverlay | None, message: str, timeout: int = 2
 ) -> None:
-    """Schedule a toast notification on the main thread."""
+    """Show a toast notification, scheduling it onto the main thread if needed."""
     if toast_overlay is None:
         return
 
-    from gi.repository import Adw as AdwLib, GLib
+    adw_lib, glib = _Adw, _GLib
+    if adw_lib is None or glib is None:
+        # preflight_check() hasn't run; import on demand
+        from gi.repository import Adw as adw_lib, GLib as glib
 
     def _show() -> bool:
         try:
-            t = AdwLib.Toast.new(message)
+            t = adw_lib.Toast.new(message)
             t.set_timeout(timeout)
             toast_overlay.add_toast(t)
         except Exception:
             pass
         return False
 
-    GLib.idle_add(_show)
+    # Plain int compare; no GLib.MainContext wrapper or is_owner() call
+    if threading.get_ident() == _main_thread_id:
+        _show()
+    else:
+        glib.idle_add(_show)